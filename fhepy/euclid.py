@@ -1,6 +1,17 @@
 """
 Module for various Euclidean algorithms
 """
+import numpy as np
+
+# Operands of at most this many bits are handled by the plain
+# extended Euclidean algorithm; above it Lehmer's algorithm is used.
+# Python's own bignum divmod is fast enough that Lehmer's algorithm
+# only wins reliably (by about 1.4x) from roughly 5000 bits.
+LEHMER_THRESHOLD = 5120
+
+# Number of leading bits used for the single precision steps
+# in Lehmer's algorithm.
+LEHMER_DIGIT_BITS = 62
 
 
 def ex_euclid(a, b):
@@ -8,13 +19,22 @@ def ex_euclid(a, b):
     The extended Euclidean algorithm yields the
     gcd of inputs a and b, and also two numbers
     x and y such that a*x + b*y = gcd(a,b).
+
+    Large non-negative inputs are passed to lehmer_ex_euclid,
+    which returns the same x and y.
+    """
+    if a > 0 and b > 0 and min(a, b).bit_length() > LEHMER_THRESHOLD:
+        return lehmer_ex_euclid(a, b)
+    return _classic_ex_euclid(a, b)
+
+
+def _classic_ex_euclid(a, b, last_s=1, current_s=0, last_t=0, current_t=1):
+    """
+    The textbook extended Euclidean algorithm, optionally continuing
+    from existing coefficients for a and b.
     """
     last_remainder = a
     current_remainder = b
-    last_s = 1
-    current_s = 0
-    last_t = 0
-    current_t = 1
 
     while current_remainder > 0:
         quotient, new_remainder = divmod(last_remainder, current_remainder)
@@ -25,3 +45,91 @@ def ex_euclid(a, b):
         current_t, last_t = new_t, current_t
 
     return last_remainder, last_s, last_t
+
+
+def lehmer_ex_euclid(a, b):
+    """
+    Lehmer's variant of the extended Euclidean algorithm,
+    for non-negative a and b.
+
+    Runs of quotients are computed from the leading LEHMER_DIGIT_BITS bits
+    of the operands only, and applied to the full size operands in one go,
+    replacing many multi-precision divisions with single precision ones.
+    The quotients are exactly those of the textbook algorithm, so the
+    result is identical to ex_euclid.
+    cf. Knuth, TAOCP Vol. 2, 4.5.2, Algorithm L
+    """
+    last_s, current_s, last_t, current_t = 1, 0, 0, 1
+    if a < b:
+        a, b = b, a
+        last_s, current_s, last_t, current_t = 0, 1, 1, 0
+
+    while b.bit_length() > LEHMER_DIGIT_BITS:
+        shift = a.bit_length() - LEHMER_DIGIT_BITS
+        x = a >> shift
+        y = b >> shift
+        A, B, C, D = 1, 0, 0, 1
+        while y + C != 0 and y + D != 0:
+            quotient = (x + A) // (y + C)
+            if quotient != (x + B) // (y + D):
+                break
+            A, C = C, A - quotient*C
+            B, D = D, B - quotient*D
+            x, y = y, x - quotient*y
+
+        if B == 0:
+            quotient, remainder = divmod(a, b)
+            a, b = b, remainder
+            last_s, current_s = current_s, last_s - quotient*current_s
+            last_t, current_t = current_t, last_t - quotient*current_t
+        else:
+            a, b = A*a + B*b, C*a + D*b
+            last_s, current_s = A*last_s + B*current_s, C*last_s + D*current_s
+            last_t, current_t = A*last_t + B*current_t, C*last_t + D*current_t
+
+    return _classic_ex_euclid(a, b, last_s, current_s, last_t, current_t)
+
+
+def batch_ex_euclid(values, modulus):
+    """
+    The extended Euclidean algorithm applied elementwise to an array of
+    non-negative values, all against the same modulus (or an array of
+    moduli broadcastable against the values), running every instance in
+    lockstep with numpy.
+
+    Returns arrays g, s, t with values*s + modulus*t = g, matching
+    ex_euclid(value, modulus) elementwise.
+
+    Inputs which do not fit in int64 are handled one element at a time
+    with ex_euclid, as numpy gains nothing over Python for object arrays.
+    """
+    values, modulus = np.broadcast_arrays(np.asarray(values), np.asarray(modulus))
+    if not (
+        values.dtype.kind in 'iu' and modulus.dtype.kind in 'iu' and
+        (not values.size or max(values.max(), modulus.max()) < 2**62)
+    ):
+        return np.frompyfunc(ex_euclid, 2, 3)(values.astype(object), modulus.astype(object))
+
+    last_remainder = values.astype(np.int64)
+    current_remainder = modulus.astype(np.int64)
+    last_s = np.ones(values.shape, dtype=np.int64)
+    current_s = np.zeros(values.shape, dtype=np.int64)
+    last_t = np.zeros(values.shape, dtype=np.int64)
+    current_t = np.ones(values.shape, dtype=np.int64)
+
+    active = current_remainder > 0
+    while active.any():
+        quotient = np.where(
+            active, last_remainder // np.where(active, current_remainder, 1), 0)
+        new_remainder = last_remainder - quotient*current_remainder
+        new_s = last_s - quotient*current_s
+        new_t = last_t - quotient*current_t
+        last_remainder = np.where(active, current_remainder, last_remainder)
+        current_remainder = np.where(active, new_remainder, current_remainder)
+        last_s = np.where(active, current_s, last_s)
+        current_s = np.where(active, new_s, current_s)
+        last_t = np.where(active, current_t, last_t)
+        current_t = np.where(active, new_t, current_t)
+        active = current_remainder > 0
+
+    return last_remainder, last_s, last_t
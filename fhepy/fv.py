@@ -73,15 +73,24 @@ class FVScheme:
         A public key is a pair of polynomials, with the private key 'hidden' in
         the first of the pair.
         """
-        coefficients = []
-        for i in range(self.polynomial_modulus_degree):
-            coefficients.append(random.randint(
-                0, self.ciphertext_coefficient_modulus))
-        a = self.ciphertext_polynomials(coefficients)
+        a = self.generate_uniform_polynomial()
         e = self.generate_error_polynomial()
         _, pk0 = (e - a * private_key).divmod(self.ciphertext_polynomial_modulus)
         return (pk0, a)
 
+    def generate_uniform_polynomial(self, seed=None):
+        """
+        Generate a polynomial with coefficients drawn uniformly from
+        the ciphertext coefficient field. Passing a seed makes the
+        polynomial reproducible.
+        """
+        rng = random.Random(seed) if seed is not None else random
+        coefficients = []
+        for i in range(self.polynomial_modulus_degree):
+            coefficients.append(rng.randint(
+                0, self.ciphertext_coefficient_modulus - 1))
+        return self.ciphertext_polynomials(coefficients)
+
     def generate_error_polynomial(self):
         """
         Generate an "error polynomial", which is a polynomial with
@@ -90,7 +99,16 @@ class FVScheme:
         randomNums = np.random.normal(
             scale=3, size=self.polynomial_modulus_degree)
         randomInts = np.round(randomNums)
-        return self.ciphertext_polynomials(randomInts)
+        return self.ciphertext_polynomials([int(x) for x in randomInts])
+
+    def scale_plaintext(self, plaintext):
+        """
+        Lift the plaintext into the ciphertext polynomial ring,
+        scaling its coefficients by floor(q/t)
+        """
+        delta = self.ciphertext_coefficient_modulus // self.plaintext_coefficient_modulus
+        return self.ciphertext_polynomials(
+            [delta * coef.val for coef in plaintext.coefficients])
 
     def encrypt(self, plaintext, public_key):
         """
@@ -100,28 +118,46 @@ class FVScheme:
         e2 = self.generate_error_polynomial()
         u = self.generate_private_key()
 
-        ct0 = (
+        _, ct0 = (
             public_key[0] * u +
             e1 +
-            (
-                self.ciphertext_coefficient_modulus *
-                plaintext/self.plaintext_coefficient_modulus
-            )
+            self.scale_plaintext(plaintext)
         ).divmod(self.ciphertext_polynomial_modulus)
 
-        ct1 = (public_key[1] * u +
-               e2).divmod(self.ciphertext_polynomial_modulus)
+        _, ct1 = (public_key[1] * u +
+                  e2).divmod(self.ciphertext_polynomial_modulus)
         return (ct0, ct1)
 
+    def encrypt_symmetric(self, plaintext, private_key, seed=None):
+        """
+        Encrypt the plaintext directly with the private key.
+        Compared to encrypt, this samples one uniform polynomial and one
+        error polynomial and needs a single multiplication, and the fresh
+        ciphertext carries less noise.
+
+        The seed, if given, determines the uniform polynomial (the second
+        element of the ciphertext), so that the sender can transmit the
+        seed in place of that polynomial. A seed must never be reused
+        under the same private key: two ciphertexts sharing one leak the
+        difference of their plaintexts.
+        """
+        a = self.generate_uniform_polynomial(seed)
+        e = self.generate_error_polynomial()
+        _, ct0 = (
+            e + self.scale_plaintext(plaintext) - a * private_key
+        ).divmod(self.ciphertext_polynomial_modulus)
+        return (ct0, a)
+
     def decrypt(self, ciphertext, private_key):
         """
         Decrypt the ciphertext with the given private_key
         """
-        scaled_plaintext = (
+        _, scaled_plaintext = (
             ciphertext[1] * private_key + ciphertext[0]).divmod(self.ciphertext_polynomial_modulus)
+        q = self.ciphertext_coefficient_modulus
         unscaled_coefficients = [
-            round(coef*self.plaintext_coefficient_modulus /
-                  self.ciphertext_coefficient_modulus)
+            round(self.plaintext_coefficient_modulus *
+                  (coef.val - q if coef.val > q // 2 else coef.val) / q)
             for coef in scaled_plaintext.coefficients
         ]
         return self.plaintext_polynomials(unscaled_coefficients)
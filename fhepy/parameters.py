@@ -0,0 +1,322 @@
+"""
+Module for choosing parameters for the Fan-Vercauteren Scheme.
+
+Given a plaintext modulus t, the multiplicative depth of the circuit to be
+evaluated and a target security level, plan_parameters picks the polynomial
+modulus degree d, a ciphertext modulus q built as a product of NTT-friendly
+primes and a relinearization decomposition base:
+
+from fhepy.parameters import plan_parameters
+params = plan_parameters(plaintext_modulus=7, depth=1, security=128)
+params.polynomial_modulus_degree, params.ciphertext_moduli
+
+Every secure choice has d >= 1024, where the pure Python ring arithmetic of
+FVScheme is far too slow to use (keygen alone would take hours), so
+params.scheme() is only practical for toy parameters (security=None).
+
+The noise estimates are heuristic, following the shape of the bounds in
+https://eprint.iacr.org/2012/144 with the expansion factor of the ring
+taken to be 2*sqrt(d) rather than the worst case d.
+"""
+import math
+import operator
+import random
+from functools import reduce
+
+from fhepy.fv import FVScheme
+
+# Maximum bit length of q for each polynomial modulus degree d,
+# for a ternary secret and classical attacks, by security level in bits.
+# cf. the Homomorphic Encryption Standard, http://homomorphicencryption.org/standard/
+MAX_MODULUS_BITS = {
+    128: {1024: 27, 2048: 54, 4096: 109, 8192: 218, 16384: 438, 32768: 881},
+    192: {1024: 19, 2048: 37, 4096: 75, 8192: 152, 16384: 305, 32768: 611},
+    256: {1024: 14, 2048: 29, 4096: 58, 8192: 118, 16384: 237, 32768: 476},
+}
+
+# Degrees considered when no security level is required (toy parameters).
+INSECURE_DEGREES = [2**n for n in range(4, 16)]
+
+# Bound on the coefficients of error polynomials,
+# six standard deviations of FVScheme.generate_error_polynomial.
+ERROR_BOUND = 6 * 3
+
+DEFAULT_PRIME_BITS = (20, 30, 40, 50, 60)
+
+
+class FVParameters:
+    """
+    A set of parameters for the Fan-Vercauteren Scheme.
+
+    Args:
+        plaintext_coefficient_modulus -- "t" in the literature
+        ciphertext_moduli -- NTT-friendly primes whose product is "q"
+        polynomial_modulus_degree -- "d" in the literature
+        relinearization_base -- the decomposition base "w" for relinearization
+            keys, or None if the circuit has no multiplications
+        noise_budget -- estimated bits of noise headroom left after
+            evaluating the circuit
+    """
+
+    def __init__(self, plaintext_coefficient_modulus, ciphertext_moduli,
+                 polynomial_modulus_degree, relinearization_base, noise_budget):
+        self.plaintext_coefficient_modulus = plaintext_coefficient_modulus
+        self.ciphertext_moduli = tuple(ciphertext_moduli)
+        self.ciphertext_coefficient_modulus = reduce(operator.mul, self.ciphertext_moduli, 1)
+        self.polynomial_modulus_degree = polynomial_modulus_degree
+        self.relinearization_base = relinearization_base
+        self.noise_budget = noise_budget
+
+    def __repr__(self):
+        return (
+            f'{self.__class__.__name__}('
+            f't={self.plaintext_coefficient_modulus}, '
+            f'q={self.ciphertext_coefficient_modulus}, '
+            f'd={self.polynomial_modulus_degree}, '
+            f'w={self.relinearization_base})'
+        )
+
+    def scheme(self):
+        """
+        Instantiate an FVScheme with these parameters.
+        Only practical for small (insecure) degrees, as FVScheme's
+        polynomial arithmetic is pure Python.
+        """
+        return FVScheme(
+            plaintext_coefficient_modulus=self.plaintext_coefficient_modulus,
+            ciphertext_coefficient_modulus=self.ciphertext_coefficient_modulus,
+            polynomial_modulus_degree=self.polynomial_modulus_degree,
+        )
+
+
+def is_prime(n):
+    """
+    Miller-Rabin primality test, deterministic for n < 3.3 * 10**24
+    and probabilistic (with 40 random rounds) above that.
+    """
+    small_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+    if n < 2:
+        return False
+    for p in small_primes:
+        if n % p == 0:
+            return n == p
+    r, s = 0, n - 1
+    while s % 2 == 0:
+        r, s = r + 1, s // 2
+    if n < 3317044064679887385961981:
+        witnesses = small_primes
+    else:
+        witnesses = [random.randrange(2, n - 1) for _ in range(40)]
+    for a in witnesses:
+        x = pow(a, s, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def ntt_primes(bits, degree):
+    """
+    Yield primes of exactly the given bit length which are congruent to
+    1 mod 2*degree, so that a negacyclic NTT of size degree exists
+    modulo each of them, in decreasing order.
+    """
+    step = 2 * degree
+    candidate = (2**bits - 1) // step * step + 1
+    while candidate.bit_length() == bits:
+        if is_prime(candidate):
+            yield candidate
+        candidate -= step
+
+
+def prime_chain(required_bits, prime_bits, degree):
+    """
+    The shortest list of distinct NTT-friendly primes of prime_bits bits
+    whose product has more than required_bits bits,
+    or None if there are not enough such primes.
+    """
+    chain = []
+    product = 1
+    for prime in ntt_primes(prime_bits, degree):
+        if product.bit_length() > required_bits:
+            break
+        chain.append(prime)
+        product *= prime
+    if product.bit_length() <= required_bits:
+        return None
+    return chain
+
+
+def estimate_noise(plaintext_modulus, degree, depth, modulus_bits, relinearization_bits):
+    """
+    Heuristic bound on the noise of a ciphertext after depth
+    multiplications (each followed by relinearization) of fresh
+    public key encryptions.
+    """
+    expansion = 2 * math.sqrt(degree)
+    noise = ERROR_BOUND * (1 + 2 * expansion)
+    multiplication_factor = 2 * plaintext_modulus * expansion * (1 + expansion)
+    rounding_noise = plaintext_modulus * expansion * (1 + expansion)
+    if relinearization_bits:
+        digits = math.ceil(modulus_bits / relinearization_bits)
+        relinearization_noise = (
+            digits * 2**relinearization_bits * ERROR_BOUND * expansion)
+    else:
+        relinearization_noise = 0
+    for _ in range(depth):
+        noise = multiplication_factor * noise + rounding_noise + relinearization_noise
+    return noise
+
+
+def required_modulus_bits(plaintext_modulus, degree, depth, relinearization_bits=None):
+    """
+    The number of bits q needs for decryption to succeed,
+    i.e. for the noise to stay below q/(2t).
+    Infinite if the noise estimate overflows a float.
+    """
+    bits = 1
+    while True:
+        noise = estimate_noise(
+            plaintext_modulus, degree, depth, bits, relinearization_bits)
+        if math.isinf(noise):
+            return math.inf
+        needed = math.ceil(math.log2(2 * plaintext_modulus * noise)) + 1
+        if needed <= bits:
+            return needed
+        bits = needed
+
+
+def choose_relinearization_bits(plaintext_modulus, degree, depth):
+    """
+    The largest k such that relinearization with base w = 2**k adds no
+    more noise than multiplying two fresh ciphertexts does, so that the
+    relinearization keys are as short as possible without the
+    relinearization noise dominating. None when depth is 0,
+    or when the noise estimate overflows.
+    """
+    if depth == 0:
+        return None
+    base_bits = required_modulus_bits(plaintext_modulus, degree, depth)
+    if math.isinf(base_bits):
+        return None
+    expansion = 2 * math.sqrt(degree)
+    fresh_noise = ERROR_BOUND * (1 + 2 * expansion)
+    multiplication_noise = (
+        2 * plaintext_modulus * expansion * (1 + expansion) * fresh_noise)
+    for bits in range(base_bits, 0, -1):
+        digits = math.ceil(base_bits / bits)
+        if digits * 2**bits * ERROR_BOUND * expansion <= multiplication_noise:
+            return bits
+    return 1
+
+
+def _undominated_chains(chains):
+    """
+    Filter (modulus_bits, chain) pairs down to those for which no other
+    pair has at most as many bits and at most as many primes,
+    keeping the first of any equivalent pairs.
+    """
+    kept = []
+    for modulus_bits, chain in chains:
+        if any(
+            kept_bits <= modulus_bits and len(kept_chain) <= len(chain)
+            for kept_bits, kept_chain in kept
+        ):
+            continue
+        kept = [
+            (kept_bits, kept_chain) for kept_bits, kept_chain in kept
+            if not (modulus_bits <= kept_bits and len(chain) <= len(kept_chain))
+        ]
+        kept.append((modulus_bits, chain))
+    return kept
+
+
+def candidate_parameters(plaintext_modulus, depth, security=128,
+                         prime_bits=DEFAULT_PRIME_BITS, degrees=None):
+    """
+    Yield the FVParameters meeting the security and noise constraints,
+    for each polynomial modulus degree and each size of prime in the
+    ciphertext modulus chain.
+
+    For each degree, candidates whose q has no fewer bits and no fewer
+    primes than another candidate's are dropped, so that no two yielded
+    candidates are equivalent.
+    """
+    if security is None:
+        max_bits = {degree: math.inf for degree in INSECURE_DEGREES}
+    elif security in MAX_MODULUS_BITS:
+        max_bits = MAX_MODULUS_BITS[security]
+    else:
+        raise ValueError(
+            f"The security level must be one of {sorted(MAX_MODULUS_BITS)} or None."
+        )
+    if degrees is None:
+        degrees = sorted(max_bits)
+
+    for degree in degrees:
+        if degree not in max_bits:
+            continue
+        relinearization_bits = choose_relinearization_bits(
+            plaintext_modulus, degree, depth)
+        needed = required_modulus_bits(
+            plaintext_modulus, degree, depth, relinearization_bits)
+        if needed > max_bits[degree]:
+            continue
+        chains = []
+        for bits in prime_bits:
+            if bits < (2 * degree).bit_length() + 1:
+                continue
+            chain = prime_chain(needed, bits, degree)
+            if chain is None:
+                continue
+            modulus_bits = reduce(operator.mul, chain, 1).bit_length()
+            if modulus_bits > max_bits[degree]:
+                continue
+            chains.append((modulus_bits, chain))
+
+        for modulus_bits, chain in _undominated_chains(chains):
+            noise = estimate_noise(
+                plaintext_modulus, degree, depth, modulus_bits, relinearization_bits)
+            budget = modulus_bits - 1 - math.log2(2 * plaintext_modulus * noise)
+            yield FVParameters(
+                plaintext_coefficient_modulus=plaintext_modulus,
+                ciphertext_moduli=chain,
+                polynomial_modulus_degree=degree,
+                relinearization_base=(
+                    2**relinearization_bits if relinearization_bits else None),
+                noise_budget=budget,
+            )
+
+
+def plan_parameters(plaintext_modulus, depth, security=128,
+                    prime_bits=DEFAULT_PRIME_BITS, degrees=None):
+    """
+    Choose parameters for evaluating circuits of the given multiplicative
+    depth on plaintexts mod plaintext_modulus, at the given security level
+    (128, 192 or 256 bits, or None for insecure toy parameters).
+
+    The cost of the scheme grows with d, and for a given d with the number
+    of primes in q (one residue polynomial per prime) and then with the
+    size of q. So of the candidates from candidate_parameters, the one at
+    the smallest viable degree with the fewest primes and then the
+    smallest q is returned. The choice is deterministic.
+
+    Raises ValueError if no candidate meets the constraints.
+    """
+    candidates = list(candidate_parameters(
+        plaintext_modulus, depth, security, prime_bits, degrees))
+    if not candidates:
+        raise ValueError(
+            "No parameters meet the security and noise constraints; "
+            "try a lower depth, a smaller plaintext modulus or larger degrees."
+        )
+    return min(candidates, key=lambda params: (
+        params.polynomial_modulus_degree,
+        len(params.ciphertext_moduli),
+        params.ciphertext_coefficient_modulus,
+    ))
@@ -127,6 +127,8 @@ class PolynomialBase:
     def __eq__(self, other):
         if isinstance(other, int):
             return self == self.__class__([other])
+        if not isinstance(other, PolynomialBase):
+            return NotImplemented
         for a, b in zip_longest(self.coefficients, other.coefficients, fillvalue=self.field(0)):
             if a != b:
                 return False
@@ -0,0 +1,264 @@
+"""
+Module for encrypting and decrypting streams of bytes with an FVScheme.
+
+The input is split into chunks which each fit into a single plaintext
+polynomial, and each chunk is encrypted and written out as it is read,
+so memory use does not depend on the size of the input.
+
+For instance, to encrypt one file into another:
+
+from fhepy.fv import FVScheme
+from fhepy.streaming import encrypt_file, decrypt_file
+fv = FVScheme(
+        plaintext_coefficient_modulus=7,
+        ciphertext_coefficient_modulus=874,
+        polynomial_modulus_degree=16,
+     )
+private_key, public_key = fv.keygen()
+with open('data.bin', 'rb') as infile, open('data.fv', 'wb') as outfile:
+    encrypt_file(fv, infile, outfile, public_key)
+with open('data.fv', 'rb') as infile, open('data.out', 'wb') as outfile:
+    decrypt_file(fv, infile, outfile, private_key)
+
+The encrypted stream starts with a header recording the scheme parameters:
+the magic bytes STREAM_MAGIC, d as a 4 byte big-endian integer, then t and q,
+each as a 2 byte big-endian byte count followed by the big-endian integer.
+Reading a stream with a scheme whose parameters differ raises ValueError.
+
+The header is followed by a sequence of frames, one per ciphertext:
+a 4 byte big-endian count of the plaintext bytes in the frame
+(at most chunk_size(fv)), followed
+by the 2*d coefficients of the ciphertext polynomials, each written as
+a fixed width big-endian integer.
+"""
+import struct
+
+STREAM_MAGIC = b'FHEPY-FV'
+DEGREE_HEADER = struct.Struct('>I')
+INTEGER_LENGTH = struct.Struct('>H')
+FRAME_HEADER = struct.Struct('>I')
+
+
+def bits_per_coefficient(fv):
+    """
+    The number of bits of plaintext which fit into a single coefficient
+    mod t.
+    """
+    bits = fv.plaintext_coefficient_modulus.bit_length() - 1
+    if bits < 1:
+        raise ValueError(
+            "The plaintext_coefficient_modulus must be at least 2 to encode bytes."
+        )
+    return bits
+
+
+def chunk_size(fv):
+    """
+    The number of bytes which fit into a single plaintext polynomial.
+    """
+    size = fv.polynomial_modulus_degree * bits_per_coefficient(fv) // 8
+    if size < 1:
+        raise ValueError(
+            "The plaintext polynomials are too small to hold a single byte."
+        )
+    return size
+
+
+def coefficient_width(fv):
+    """
+    The number of bytes used to serialize one ciphertext coefficient.
+    """
+    return (fv.ciphertext_coefficient_modulus.bit_length() + 7) // 8
+
+
+def read_up_to(fileobj, size):
+    """
+    Read from fileobj until size bytes have been read or EOF is reached.
+    Raw and non-blocking file objects may return fewer bytes than asked for
+    (or None, when no data is available yet) before EOF.
+    """
+    data = bytearray()
+    while len(data) < size:
+        piece = fileobj.read(size - len(data))
+        if piece is None:
+            continue
+        if not piece:
+            break
+        data += piece
+    return bytes(data)
+
+
+def iter_chunks(data, size):
+    """
+    Yield successive chunks of at most size bytes from data, which may be
+    a binary file object or an iterable of bytes objects.
+    Only the final chunk may be shorter than size.
+    """
+    if hasattr(data, 'read'):
+        while True:
+            chunk = read_up_to(data, size)
+            if not chunk:
+                return
+            yield chunk
+    buffer = bytearray()
+    for piece in data:
+        buffer += piece
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def encode_chunk(fv, chunk):
+    """
+    Pack a chunk of bytes into the coefficients of a plaintext polynomial,
+    bits_per_coefficient(fv) bits at a time, least significant first.
+    """
+    bits = bits_per_coefficient(fv)
+    mask = (1 << bits) - 1
+    value = int.from_bytes(chunk, 'little')
+    coefficients = [
+        (value >> (i * bits)) & mask
+        for i in range((len(chunk) * 8 + bits - 1) // bits)
+    ]
+    return fv.plaintext_polynomials(coefficients)
+
+
+def decode_chunk(fv, plaintext, length):
+    """
+    Recover length bytes from a plaintext polynomial built by encode_chunk.
+    """
+    bits = bits_per_coefficient(fv)
+    value = 0
+    for i, coef in enumerate(plaintext.coefficients):
+        value |= coef.val << (i * bits)
+    return (value & ((1 << (length * 8)) - 1)).to_bytes(length, 'little')
+
+
+def encrypt_stream(fv, data, public_key):
+    """
+    Lazily encrypt data (a binary file object or an iterable of bytes),
+    yielding (length, ciphertext) pairs, one per chunk.
+    """
+    for chunk in iter_chunks(data, chunk_size(fv)):
+        yield len(chunk), fv.encrypt(encode_chunk(fv, chunk), public_key)
+
+
+def decrypt_stream(fv, frames, private_key):
+    """
+    Lazily decrypt (length, ciphertext) pairs, yielding the original bytes.
+    """
+    for length, ciphertext in frames:
+        yield decode_chunk(fv, fv.decrypt(ciphertext, private_key), length)
+
+
+def _read_exactly(infile, size):
+    data = read_up_to(infile, size)
+    if len(data) != size:
+        raise ValueError("Truncated ciphertext stream header.")
+    return data
+
+
+def write_stream_header(fv, outfile):
+    """
+    Write the magic bytes and the parameters d, t and q of fv to outfile.
+    """
+    outfile.write(STREAM_MAGIC)
+    outfile.write(DEGREE_HEADER.pack(fv.polynomial_modulus_degree))
+    for modulus in (fv.plaintext_coefficient_modulus, fv.ciphertext_coefficient_modulus):
+        encoded = modulus.to_bytes((modulus.bit_length() + 7) // 8, 'big')
+        outfile.write(INTEGER_LENGTH.pack(len(encoded)))
+        outfile.write(encoded)
+
+
+def read_stream_header(fv, infile):
+    """
+    Read a header written by write_stream_header from infile,
+    raising ValueError if it is missing or its parameters differ from fv's.
+    """
+    if _read_exactly(infile, len(STREAM_MAGIC)) != STREAM_MAGIC:
+        raise ValueError("Not an encrypted fhepy stream.")
+    (degree,) = DEGREE_HEADER.unpack(_read_exactly(infile, DEGREE_HEADER.size))
+    moduli = []
+    for _ in range(2):
+        (size,) = INTEGER_LENGTH.unpack(_read_exactly(infile, INTEGER_LENGTH.size))
+        moduli.append(int.from_bytes(_read_exactly(infile, size), 'big'))
+    expected = (
+        fv.polynomial_modulus_degree,
+        fv.plaintext_coefficient_modulus,
+        fv.ciphertext_coefficient_modulus,
+    )
+    if (degree, *moduli) != expected:
+        raise ValueError(
+            f"The stream was encrypted with (d, t, q) = {(degree, *moduli)}, "
+            f"but the scheme has {expected}."
+        )
+
+
+def write_frames(fv, frames, outfile):
+    """
+    Serialize (length, ciphertext) pairs to the binary file outfile,
+    preceded by the stream header.
+    """
+    width = coefficient_width(fv)
+    degree = fv.polynomial_modulus_degree
+    write_stream_header(fv, outfile)
+    for length, ciphertext in frames:
+        outfile.write(FRAME_HEADER.pack(length))
+        for polynomial in ciphertext:
+            coefficients = [coef.val for coef in polynomial.coefficients]
+            coefficients += [0] * (degree - len(coefficients))
+            outfile.write(b''.join(
+                int(coef).to_bytes(width, 'big') for coef in coefficients
+            ))
+
+
+def read_frames(fv, infile):
+    """
+    Lazily read (length, ciphertext) pairs written by write_frames
+    from the binary file infile, after checking the stream header.
+    """
+    width = coefficient_width(fv)
+    degree = fv.polynomial_modulus_degree
+    body_size = 2 * degree * width
+    max_length = chunk_size(fv)
+    read_stream_header(fv, infile)
+    while True:
+        header = read_up_to(infile, FRAME_HEADER.size)
+        if not header:
+            return
+        body = read_up_to(infile, body_size)
+        if len(header) != FRAME_HEADER.size or len(body) != body_size:
+            raise ValueError("Truncated ciphertext frame.")
+        (length,) = FRAME_HEADER.unpack(header)
+        if length > max_length:
+            raise ValueError(
+                f"Ciphertext frame claims {length} bytes, "
+                f"but at most {max_length} fit in one ciphertext."
+            )
+        coefficients = [
+            int.from_bytes(body[i:i + width], 'big')
+            for i in range(0, body_size, width)
+        ]
+        yield length, (
+            fv.ciphertext_polynomials(coefficients[:degree]),
+            fv.ciphertext_polynomials(coefficients[degree:]),
+        )
+
+
+def encrypt_file(fv, data, outfile, public_key):
+    """
+    Encrypt data (a binary file object or an iterable of bytes)
+    chunk by chunk, writing the framed ciphertexts to outfile.
+    """
+    write_frames(fv, encrypt_stream(fv, data, public_key), outfile)
+
+
+def decrypt_file(fv, infile, outfile, private_key):
+    """
+    Decrypt the framed ciphertexts in infile chunk by chunk,
+    writing the recovered bytes to outfile.
+    """
+    for chunk in decrypt_stream(fv, read_frames(fv, infile), private_key):
+        outfile.write(chunk)
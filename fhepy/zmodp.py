@@ -6,8 +6,16 @@ For instance, for arithmetic mod 7, instantiate the integers mod 7 with:
 from zmodp import ZMod
 Z7 = ZMod(7)
 assert Z7(3) + Z7(4) == 0
+
+Each such class also carries an Array class for vectorized arithmetic
+on many residues at once, backed by a numpy array:
+
+A = Z7.Array([1, 2, 3])
+assert list(A * 3) == [3, 6, 2]
 """
-from fhepy.euclid import ex_euclid
+import numpy as np
+
+from fhepy.euclid import batch_ex_euclid, ex_euclid
 
 
 class ZModBase:
@@ -26,16 +34,26 @@ class ZModBase:
         self.val = val % self.base
 
     def __add__(self, other):
-        return self.__class__(self.val + other.val)
+        if isinstance(other, ZModBase):
+            return self.__class__(self.val + other.val)
+        if isinstance(other, int):
+            return self.__class__(self.val + other)
+        return NotImplemented
 
     def __sub__(self, other):
-        return self.__class__(self.val - other.val)
+        if isinstance(other, ZModBase):
+            return self.__class__(self.val - other.val)
+        if isinstance(other, int):
+            return self.__class__(self.val - other)
+        return NotImplemented
 
     def __mul__(self, other):
         if isinstance(other, ZModBase):
             val = self.val * other.val
-        else:
+        elif isinstance(other, int):
             val = self.val * other
+        else:
+            return NotImplemented
         return self.__class__(val)
 
     def __rmul__(self, other):
@@ -47,6 +65,8 @@ class ZModBase:
         """
         self/other == self * other**-1
         """
+        if not isinstance(other, (ZModBase, int)):
+            return NotImplemented
         if other == 0:
             raise ZeroDivisionError
         if isinstance(other, ZModBase):
@@ -81,6 +101,183 @@ class ZModBase:
         return self.__class__(s)
 
 
+def _unwrap_residue(value):
+    if isinstance(value, ZModBase):
+        return value.val
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    raise TypeError(f"ZMod arrays require integer values, not {type(value).__name__}.")
+
+
+_unwrap_residues = np.frompyfunc(_unwrap_residue, 1, 1)
+
+
+class ZModArrayBase:
+    """
+    Base class for arrays of integers mod some value.
+
+    The residues are held in a numpy array, as int64 when the product of
+    any two residues fits in 64 bits and as Python ints (object dtype)
+    otherwise. Basic indexing and slicing return views onto the same buffer.
+
+    Used by the class builder function ZMod below.
+    """
+    base = None
+    field = None
+    dtype = None
+    # Make numpy arrays and scalars on the left of an operator defer to
+    # the reflected methods here, rather than operating elementwise.
+    __array_ufunc__ = None
+
+    def __init__(self, values):
+        """
+        values may be an array of integers, an iterable of integers or
+        ZMod elements, or another ZMod array. Non-integral values raise
+        TypeError.
+        """
+        if isinstance(values, ZModArrayBase):
+            values = values.values
+        values = np.asarray(values)
+        if not values.size:
+            values = values.astype(np.int64)
+        elif values.dtype.kind == 'O':
+            values = np.asarray(_unwrap_residues(values), dtype=object)
+        elif values.dtype.kind not in 'iub':
+            raise TypeError(
+                f"{self.__class__.__name__} requires integer values, not {values.dtype}."
+            )
+        if self.dtype == object:
+            values = values.astype(object)
+        self.values = np.asarray(values % self.base).astype(self.dtype)
+
+    @classmethod
+    def _wrap(cls, values):
+        """
+        Wrap an array of already reduced residues without copying it.
+        """
+        array = cls.__new__(cls)
+        array.values = values
+        return array
+
+    def _other_values(self, other):
+        if isinstance(other, ZModArrayBase):
+            return other.values
+        if isinstance(other, ZModBase):
+            return other.val
+        if isinstance(other, int):
+            return self.field(other).val
+        return self.__class__(other).values
+
+    def __str__(self):
+        return str(self.values)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.values.tolist()})'
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for val in self.values:
+            yield self.field(int(val))
+
+    def __getitem__(self, key):
+        values = self.values[key]
+        if isinstance(values, np.ndarray):
+            return self._wrap(values)
+        return self.field(int(values))
+
+    def __setitem__(self, key, value):
+        self.values[key] = self._other_values(value)
+
+    def __add__(self, other):
+        return self._wrap((self.values + self._other_values(other)) % self.base)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._wrap((self.values - self._other_values(other)) % self.base)
+
+    def __rsub__(self, other):
+        return self._wrap((self._other_values(other) - self.values) % self.base)
+
+    def __neg__(self):
+        return self._wrap(-self.values % self.base)
+
+    def __mul__(self, other):
+        return self._wrap((self.values * self._other_values(other)) % self.base)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        self/other == self * other**-1, elementwise
+        """
+        if isinstance(other, int):
+            other = self.field(other)
+        elif not isinstance(other, (ZModArrayBase, ZModBase)):
+            other = self.__class__(other)
+        return self * other.inverse()
+
+    def __rtruediv__(self, other):
+        return self.inverse() * other
+
+    def __pow__(self, exponent):
+        """
+        Elementwise exponentiation by square and multiply.
+        Negative exponents raise the inverse.
+        """
+        if exponent < 0:
+            return self.inverse() ** -exponent
+        result = self._wrap(np.ones_like(self.values) % self.base)
+        square = self
+        while exponent:
+            if exponent & 1:
+                result = result * square
+            square = square * square
+            exponent >>= 1
+        return result
+
+    def __eq__(self, other):
+        return self.values == self._other_values(other)
+
+    def __ne__(self, other):
+        return self.values != self._other_values(other)
+
+    def inverse(self):
+        """
+        Return the elementwise multiplicative inverse.
+        Raises ZeroDivisionError if any element is not invertible.
+        """
+        gcd, s, _ = batch_ex_euclid(self.values, self.base)
+        if (np.asarray(gcd) != 1).any():
+            raise ZeroDivisionError
+        return self._wrap(np.asarray(np.asarray(s) % self.base).astype(self.dtype))
+
+    def sum(self):
+        """
+        Sum of all elements, as a single ZMod element.
+        """
+        return self.field(int(self.values.sum(dtype=object)))
+
+    def prod(self):
+        """
+        Product of all elements, as a single ZMod element,
+        computed by multiplying pairs of elements until one remains.
+        """
+        values = self.values.ravel()
+        if not values.size:
+            return self.field(1)
+        while values.size > 1:
+            if values.size % 2:
+                values = np.append(values, 1)
+            values = (values[0::2] * values[1::2]) % self.base
+        return self.field(int(values[0]))
+
+    def tolist(self):
+        return self.values.tolist()
+
+
 _memoized = {}
 
 
@@ -90,11 +287,20 @@ def ZMod(base):
     e.g. base = 3:
     class ZMod3(ZModBase):
         base = 3
+    The returned class has an attribute Array, a subclass of
+    ZModArrayBase with the same base.
     """
     if base not in _memoized:
         name = 'ZMod{}'.format(base)
         bases = (ZModBase,)
         dct = {'base': base}
-        _memoized[base] = type(name, bases, dct)
+        field = type(name, bases, dct)
+        dtype = np.dtype(np.int64) if (base - 1)**2 < 2**63 else np.dtype(object)
+        field.Array = type(
+            'ZModArray{}'.format(base),
+            (ZModArrayBase,),
+            {'base': base, 'field': field, 'dtype': dtype},
+        )
+        _memoized[base] = field
 
     return _memoized[base]
@@ -0,0 +1,12 @@
+import pytest
+
+from fhepy.fv import FVScheme
+
+
+@pytest.fixture
+def small_fv_scheme():
+    return FVScheme(
+        plaintext_coefficient_modulus=7,
+        ciphertext_coefficient_modulus=874,
+        polynomial_modulus_degree=16,
+    )
@@ -1,6 +1,41 @@
-from fhepy.euclid import ex_euclid
+import random
+
+import numpy as np
+import pytest
+
+from fhepy.euclid import (LEHMER_THRESHOLD, _classic_ex_euclid,
+                          batch_ex_euclid, ex_euclid, lehmer_ex_euclid)
 
 
 def test_ex_euclid():
     assert ex_euclid(240, 46) == (2, -9, 47)
     assert ex_euclid(46, 240) == (2, 47, -9)
+
+
+@pytest.mark.parametrize('bits', [1, 8, 62, 63, 200, 1000, LEHMER_THRESHOLD + 100])
+def test_lehmer_ex_euclid(bits):
+    rng = random.Random(bits)
+    for _ in range(20):
+        a = rng.getrandbits(bits)
+        b = rng.getrandbits(rng.randint(1, bits))
+        assert lehmer_ex_euclid(a, b) == _classic_ex_euclid(a, b)
+        assert lehmer_ex_euclid(b, a) == _classic_ex_euclid(b, a)
+        assert ex_euclid(a, b) == _classic_ex_euclid(a, b)
+
+
+@pytest.mark.parametrize('modulus', [874, 2**61 - 1, 2**127 - 1])
+def test_batch_ex_euclid(modulus):
+    rng = random.Random(modulus)
+    values = [0, 1, modulus - 1] + [rng.randrange(modulus) for _ in range(50)]
+    if modulus < 2**62:
+        values = np.array(values, dtype=np.int64)
+    gcds, s, t = batch_ex_euclid(values, modulus)
+    for value, g, x, y in zip(values, gcds, s, t):
+        assert (g, x, y) == ex_euclid(int(value), modulus)
+
+
+def test_batch_ex_euclid_broadcasts_moduli():
+    gcds, s, t = batch_ex_euclid(np.array([3, 4, 0]), np.array([7, 10, 5]))
+    assert gcds.tolist() == [1, 2, 5]
+    assert s.tolist() == [ex_euclid(3, 7)[1], ex_euclid(4, 10)[1], 0]
+    assert t.tolist() == [ex_euclid(3, 7)[2], ex_euclid(4, 10)[2], 1]
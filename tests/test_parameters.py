@@ -0,0 +1,114 @@
+import pytest
+
+from fhepy.parameters import (MAX_MODULUS_BITS, candidate_parameters,
+                              is_prime, ntt_primes, plan_parameters,
+                              required_modulus_bits)
+
+
+def test_is_prime():
+    primes = [n for n in range(100) if is_prime(n)]
+    assert primes == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                      53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+    assert is_prime(2**61 - 1)
+    assert is_prime(2**127 - 1)
+    assert not is_prime(2**61 + 1)
+    assert not is_prime(3215031751)
+
+
+def test_ntt_primes():
+    primes = list(ntt_primes(20, 1024))
+    assert primes
+    assert primes == sorted(primes, reverse=True)
+    for prime in primes:
+        assert prime.bit_length() == 20
+        assert prime % 2048 == 1
+        assert is_prime(prime)
+
+
+def test_required_modulus_bits_grows_with_depth():
+    bits = [required_modulus_bits(7, 4096, depth, 16) for depth in range(4)]
+    assert bits == sorted(bits)
+    assert len(set(bits)) == 4
+
+
+@pytest.mark.parametrize('security', [128, 192, 256])
+@pytest.mark.parametrize('depth', [0, 1, 3])
+def test_candidates_meet_constraints(security, depth):
+    candidates = list(candidate_parameters(7, depth, security))
+    assert candidates
+    for params in candidates:
+        degree = params.polynomial_modulus_degree
+        q = params.ciphertext_coefficient_modulus
+        assert q.bit_length() <= MAX_MODULUS_BITS[security][degree]
+        relinearization_bits = (
+            params.relinearization_base.bit_length() - 1
+            if params.relinearization_base else None)
+        assert q.bit_length() > required_modulus_bits(
+            7, degree, depth, relinearization_bits)
+        assert params.noise_budget > 0
+        assert all(prime % (2 * degree) == 1 for prime in params.ciphertext_moduli)
+        assert (params.relinearization_base is None) == (depth == 0)
+
+
+def test_plan_prefers_smallest_degree():
+    params = plan_parameters(7, 0, security=128)
+    assert params.polynomial_modulus_degree == 1024
+
+
+def test_plan_impossible():
+    with pytest.raises(ValueError):
+        plan_parameters(7, 50, security=256)
+    with pytest.raises(ValueError):
+        plan_parameters(7, 0, security=100)
+
+
+def test_plan_toy_parameters_usable():
+    params = plan_parameters(
+        7, 1, security=None, degrees=[16], prime_bits=(30, 40))
+    fv = params.scheme()
+    private_key, public_key = fv.keygen()
+    message = fv.plaintext_polynomials(range(15))
+    assert fv.decrypt(fv.encrypt(message, public_key), private_key) == message
+
+
+@pytest.mark.parametrize('security', [128, None])
+def test_candidates_not_dominated(security):
+    candidates = list(candidate_parameters(
+        7, 2, security, degrees=[16, 32, 2048, 4096, 8192]))
+    assert candidates
+    for a in candidates:
+        for b in candidates:
+            if a is b or a.polynomial_modulus_degree != b.polynomial_modulus_degree:
+                continue
+            assert not (
+                a.ciphertext_coefficient_modulus.bit_length() <=
+                b.ciphertext_coefficient_modulus.bit_length() and
+                len(a.ciphertext_moduli) <= len(b.ciphertext_moduli)
+            )
+
+
+@pytest.mark.parametrize('depth', [0, 1, 3, 4])
+def test_plan_secure(depth):
+    params = plan_parameters(7, depth, security=128)
+    candidates = list(candidate_parameters(7, depth, 128))
+    smallest_degree = min(
+        candidate.polynomial_modulus_degree for candidate in candidates)
+    assert params.polynomial_modulus_degree == smallest_degree
+    fewest_primes = min(
+        len(candidate.ciphertext_moduli) for candidate in candidates
+        if candidate.polynomial_modulus_degree == smallest_degree)
+    assert len(params.ciphertext_moduli) == fewest_primes
+    assert params.ciphertext_coefficient_modulus.bit_length() <= (
+        MAX_MODULUS_BITS[128][smallest_degree])
+
+
+@pytest.mark.parametrize('t,depth,security', [
+    (7, 4, 128), (65537, 7, 128), (7, 2, 192), (257, 1, 256),
+])
+def test_plan_is_deterministic(t, depth, security):
+    plans = [plan_parameters(t, depth, security) for _ in range(5)]
+    assert len({
+        (params.polynomial_modulus_degree, params.ciphertext_moduli,
+         params.relinearization_base)
+        for params in plans
+    }) == 1
@@ -0,0 +1,136 @@
+import io
+
+import pytest
+
+from fhepy.fv import FVScheme
+from fhepy.streaming import (FRAME_HEADER, chunk_size, decode_chunk,
+                             decrypt_file, decrypt_stream, encode_chunk,
+                             encrypt_file, encrypt_stream, iter_chunks,
+                             write_stream_header)
+
+
+def test_iter_chunks_file():
+    assert list(iter_chunks(io.BytesIO(b'abcdefg'), 3)) == [b'abc', b'def', b'g']
+
+
+class ShortReads(io.RawIOBase):
+    """
+    A raw stream returning at most two bytes per read,
+    and None (no data available yet) on every other call.
+    """
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+        self.calls = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        self.calls += 1
+        if self.calls % 2:
+            return None
+        return self.data.read(min(size, 2))
+
+
+def test_iter_chunks_short_reads():
+    assert list(iter_chunks(ShortReads(b'abcdefg'), 3)) == [b'abc', b'def', b'g']
+
+
+def test_decrypt_file_short_reads(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    data = b'short reads are not the end of the stream'
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, ShortReads(data), encrypted, public_key)
+    decrypted = io.BytesIO()
+    decrypt_file(
+        small_fv_scheme, ShortReads(encrypted.getvalue()), decrypted, private_key)
+    assert decrypted.getvalue() == data
+
+
+def test_iter_chunks_iterable():
+    assert list(iter_chunks([b'ab', b'', b'cdefg'], 3)) == [b'abc', b'def', b'g']
+
+
+@pytest.mark.parametrize('chunk', [b'', b'\x00', b'\xff\x01', b'\x00\xff\x00\x80'])
+def test_encode_decode_chunk(small_fv_scheme, chunk):
+    plaintext = encode_chunk(small_fv_scheme, chunk)
+    assert decode_chunk(small_fv_scheme, plaintext, len(chunk)) == chunk
+
+
+def test_encrypt_decrypt_stream(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    data = [b'hello ', b'homomorphic ', b'world']
+    frames = encrypt_stream(small_fv_scheme, data, public_key)
+    assert b''.join(decrypt_stream(small_fv_scheme, frames, private_key)) == b''.join(data)
+
+
+def test_encrypt_decrypt_file(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    data = bytes(range(256))[::7] * 2
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, io.BytesIO(data), encrypted, public_key)
+    header = io.BytesIO()
+    write_stream_header(small_fv_scheme, header)
+    assert len(encrypted.getvalue()) == len(header.getvalue()) + (
+        -(-len(data) // chunk_size(small_fv_scheme)) * (4 + 2 * 16 * 2)
+    )
+    encrypted.seek(0)
+    decrypted = io.BytesIO()
+    decrypt_file(small_fv_scheme, encrypted, decrypted, private_key)
+    assert decrypted.getvalue() == data
+
+
+def test_truncated_frame(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, [b'abc'], encrypted, public_key)
+    truncated = io.BytesIO(encrypted.getvalue()[:-1])
+    with pytest.raises(ValueError):
+        decrypt_file(small_fv_scheme, truncated, io.BytesIO(), private_key)
+
+
+def test_oversized_frame_length(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, [b'abcd'], encrypted, public_key)
+    header = io.BytesIO()
+    write_stream_header(small_fv_scheme, header)
+    start = len(header.getvalue())
+    data = bytearray(encrypted.getvalue())
+    data[start:start + FRAME_HEADER.size] = FRAME_HEADER.pack(10**6)
+    decrypted = io.BytesIO()
+    with pytest.raises(ValueError):
+        decrypt_file(small_fv_scheme, io.BytesIO(bytes(data)), decrypted, private_key)
+    assert decrypted.getvalue() == b''
+
+
+def test_mismatched_parameters(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, [b'abc'], encrypted, public_key)
+    other_fv_scheme = FVScheme(
+        plaintext_coefficient_modulus=5,
+        ciphertext_coefficient_modulus=874,
+        polynomial_modulus_degree=16,
+    )
+    encrypted.seek(0)
+    with pytest.raises(ValueError):
+        decrypt_file(other_fv_scheme, encrypted, io.BytesIO(), private_key)
+
+
+@pytest.mark.parametrize('data', [b'', b'not a stream at all'])
+def test_missing_header(small_fv_scheme, data):
+    private_key, _ = small_fv_scheme.keygen()
+    with pytest.raises(ValueError):
+        decrypt_file(small_fv_scheme, io.BytesIO(data), io.BytesIO(), private_key)
+
+
+def test_empty_stream(small_fv_scheme):
+    private_key, public_key = small_fv_scheme.keygen()
+    encrypted = io.BytesIO()
+    encrypt_file(small_fv_scheme, [], encrypted, public_key)
+    encrypted.seek(0)
+    decrypted = io.BytesIO()
+    decrypt_file(small_fv_scheme, encrypted, decrypted, private_key)
+    assert decrypted.getvalue() == b''
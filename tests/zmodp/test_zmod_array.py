@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from fhepy.polynomials import Polynomials
+from fhepy.zmodp import ZMod, ZModArrayBase
+
+Z7 = ZMod(7)
+ZBig = ZMod(2**127 - 1)
+
+
+def test_array_class():
+    assert issubclass(Z7.Array, ZModArrayBase)
+    assert Z7.Array.field is Z7
+    assert Z7.Array([1]).values.dtype == np.int64
+    assert ZBig.Array([1]).values.dtype == object
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_arithmetic_matches_scalars(field):
+    a = [0, 1, 5, -3, 2**70]
+    b = [3, 6, 2, 4, -2**65]
+    A, B = field.Array(a), field.Array(b)
+    for x, y, s, d, p in zip(a, b, A + B, A - B, A * B):
+        assert s == field(x) + field(y)
+        assert d == field(x) - field(y)
+        assert p == field(x) * field(y)
+    assert list(-A) == [field(0) - field(x) for x in a]
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_scalar_operands(field):
+    A = field.Array([1, 2, 3])
+    assert (A + 5).tolist() == [(x + 5) % field.base for x in [1, 2, 3]]
+    assert (5 - A).tolist() == [(5 - x) % field.base for x in [1, 2, 3]]
+    assert (A * field(4)).tolist() == [(4 * x) % field.base for x in [1, 2, 3]]
+    assert (2 * A).tolist() == [2, 4, 6]
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_division_inverse_pow(field):
+    A = field.Array([1, 2, 3, 4, 5, 6])
+    assert all((A * A.inverse()) == 1)
+    assert all(((A / A) == 1))
+    assert all((A / 3) * 3 == A)
+    assert list(A ** 3) == [field(x) * field(x) * field(x) for x in range(1, 7)]
+    assert all((A ** -1) == A.inverse())
+    assert all((A ** 0) == 1)
+
+
+def test_inverse_of_zero():
+    with pytest.raises(ZeroDivisionError):
+        Z7.Array([1, 0]).inverse()
+
+
+def test_comparison():
+    A = Z7.Array([1, 8, 3])
+    assert (A == [1, 1, 4]).tolist() == [True, True, False]
+    assert (A != Z7.Array([1, 1, 4])).tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_reductions(field):
+    values = [3, 5, -1, 2**80, 6]
+    A = field.Array(values)
+    total, product = field(0), field(1)
+    for x in values:
+        total = total + field(x)
+        product = product * field(x)
+    assert A.sum() == total
+    assert A.prod() == product
+    assert field.Array([]).prod() == 1
+
+
+def test_indexing_and_views():
+    A = Z7.Array(range(10))
+    assert A[3] == Z7(3)
+    assert isinstance(A[3], Z7)
+    view = A[2:6]
+    assert isinstance(view, Z7.Array)
+    assert np.shares_memory(view.values, A.values)
+    view[0] = 9
+    assert A[2] == 2 and A[2].val == 2
+    A[::2] = Z7.Array([1, 1, 1, 1, 1])
+    assert view.tolist() == [1, 3, 1, 5]
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_construct_from_field_elements(field):
+    A = field.Array([field(1), field(2), 3])
+    assert A.tolist() == [1, 2, 3]
+    P = Polynomials(field)
+    assert field.Array(P([5, 0, 4]).coefficients).tolist() == [5, 0, 4]
+
+
+def test_construct_from_array():
+    A = Z7.Array([1, 2, 3])
+    B = Z7.Array(A)
+    assert B.tolist() == [1, 2, 3]
+    assert not np.shares_memory(A.values, B.values)
+    assert ZMod(2).Array(A).tolist() == [1, 0, 1]
+    assert ZBig.Array(A).tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize('values', [[1.7, 2.2], [1.0], [1, 'a'], [Z7(1), 0.5]])
+def test_construct_from_non_integers(values):
+    with pytest.raises(TypeError):
+        Z7.Array(values)
+
+
+def test_construct_empty():
+    assert Z7.Array([]).tolist() == []
+    assert len(ZBig.Array([])) == 0
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_scalar_on_either_side(field):
+    A = field.Array([1, 2, 3])
+    x = field(6)
+    assert (x * A).tolist() == (A * x).tolist() == [(6 * v) % field.base for v in [1, 2, 3]]
+    assert (x + A).tolist() == (A + x).tolist() == [(6 + v) % field.base for v in [1, 2, 3]]
+    assert (x - A).tolist() == [(6 - v) % field.base for v in [1, 2, 3]]
+    assert (A - x).tolist() == [(v - 6) % field.base for v in [1, 2, 3]]
+    assert all((x / A) * A == x)
+    assert all((A / x) * x == A)
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+@pytest.mark.parametrize('left', [np.array([1, 2, 3]), np.int64(3)])
+def test_numpy_operand_on_left(field, left):
+    A = field.Array([4, 5, 6])
+    expected = np.broadcast_to(left, 3).tolist()
+    for result, op in [
+        (left * A, lambda x, y: x * y),
+        (left + A, lambda x, y: x + y),
+        (left - A, lambda x, y: x - y),
+    ]:
+        assert isinstance(result, field.Array)
+        assert result.tolist() == [
+            op(x, y) % field.base for x, y in zip(expected, [4, 5, 6])]
+    quotient = left / A
+    assert isinstance(quotient, field.Array)
+    assert all(quotient * A == field.Array(expected))
+    assert (left == A).tolist() == [x == y for x, y in zip(expected, [4, 5, 6])]
+
+
+@pytest.mark.parametrize('field', [Z7, ZBig])
+def test_division_by_sequence(field):
+    A = field.Array([4, 5, 6])
+    for divisor in ([1, 2, 3], np.array([1, 2, 3])):
+        quotient = A / divisor
+        assert isinstance(quotient, field.Array)
+        assert all(quotient * [1, 2, 3] == A)
+    assert all((A / np.int64(2)) * 2 == A)